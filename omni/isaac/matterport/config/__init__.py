@@ -4,6 +4,18 @@
 #
 # SPDX-License-Identifier: BSD-3-Clause
 
-from .importer_cfg import AssetConverterContext, MatterportImporterCfg
+from .importer_cfg import MatterportImporterCfg
 
 __all__ = ["MatterportImporterCfg", "AssetConverterContext"]
+
+
+def __getattr__(name: str):
+    # the asset converter extension is only enabled once its context class is requested
+    if name == "AssetConverterContext":
+        from isaacsim.core.utils import extensions
+
+        extensions.enable_extension("omni.kit.asset_converter")
+        from omni.kit.asset_converter.impl import AssetConverterContext
+
+        return AssetConverterContext
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 from dataclasses import MISSING
+from typing import Any
 
 from isaacsim.core.utils import extensions
 # Local import: avoid broken legacy path and circulars
@@ -13,31 +14,40 @@ from isaaclab.terrains import TerrainImporterCfg
 from isaaclab.utils import configclass
 from typing_extensions import Literal
 
-# Ensure asset converter is available (5.0 and 4.x)
-extensions.enable_extension("omni.kit.asset_converter")
-from omni.kit.asset_converter.impl import AssetConverterContext
-
-# NOTE: hope to be changed to dataclass later; we configure a default context now.
-asset_converter_cfg: AssetConverterContext = AssetConverterContext()
-asset_converter_cfg.ignore_materials = False
-asset_converter_cfg.ignore_animations = False
-asset_converter_cfg.ignore_camera = False
-asset_converter_cfg.ignore_light = False
-asset_converter_cfg.single_mesh = False
-asset_converter_cfg.smooth_normals = True
-asset_converter_cfg.export_preview_surface = False
-asset_converter_cfg.use_meter_as_world_unit = True
-asset_converter_cfg.create_world_as_default_root_prim = True
-asset_converter_cfg.embed_textures = True
-asset_converter_cfg.convert_fbx_to_y_up = False
-asset_converter_cfg.convert_fbx_to_z_up = True
-asset_converter_cfg.keep_all_materials = False
-asset_converter_cfg.merge_all_meshes = False
-asset_converter_cfg.use_double_precision_to_usd_transform_op = False
-asset_converter_cfg.ignore_pivots = False
-asset_converter_cfg.disabling_instancing = False
-asset_converter_cfg.export_hidden_props = False
-asset_converter_cfg.baking_scales = False
+
+def _make_asset_converter_cfg(cfg: "MatterportImporterCfg | None" = None):
+    """Create the asset converter context from the conversion settings of the importer config.
+
+    Enabling the asset converter extension is deferred to here, so importing a pre-converted USD does
+    not pay for loading it.
+    """
+    if cfg is None:
+        cfg = MatterportImporterCfg()
+    extensions.enable_extension("omni.kit.asset_converter")
+    from omni.kit.asset_converter.impl import AssetConverterContext
+
+    # NOTE: hope to be changed to dataclass later; we configure a default context now.
+    asset_converter_cfg = AssetConverterContext()
+    asset_converter_cfg.ignore_materials = False
+    asset_converter_cfg.ignore_animations = cfg.ignore_animations
+    asset_converter_cfg.ignore_camera = cfg.ignore_camera
+    asset_converter_cfg.ignore_light = cfg.ignore_light
+    asset_converter_cfg.single_mesh = False
+    asset_converter_cfg.smooth_normals = cfg.smooth_normals
+    asset_converter_cfg.export_preview_surface = False
+    asset_converter_cfg.use_meter_as_world_unit = True
+    asset_converter_cfg.create_world_as_default_root_prim = True
+    asset_converter_cfg.embed_textures = cfg.embed_textures
+    asset_converter_cfg.convert_fbx_to_y_up = False
+    asset_converter_cfg.convert_fbx_to_z_up = True
+    asset_converter_cfg.keep_all_materials = False
+    asset_converter_cfg.merge_all_meshes = cfg.merge_all_meshes
+    asset_converter_cfg.use_double_precision_to_usd_transform_op = False
+    asset_converter_cfg.ignore_pivots = False
+    asset_converter_cfg.disabling_instancing = False
+    asset_converter_cfg.export_hidden_props = False
+    asset_converter_cfg.baking_scales = False
+    return asset_converter_cfg
 
 
 @configclass
@@ -55,7 +65,35 @@ class MatterportImporterCfg(TerrainImporterCfg):
     # Accept .usd directly; if .obj is provided we attempt conversion.
     obj_filepath: str = ""
 
-    asset_converter: AssetConverterContext = asset_converter_cfg
+    asset_converter: Any = None
+    """Asset converter context (``AssetConverterContext``) used for OBJ->USD conversion.
+
+    If None, a context is created from the conversion settings below the first time a conversion is needed.
+    """
+
+    # Conversion settings, only used if :attr:`asset_converter` is None.
+    # Matterport scans contain no animations, cameras or lights and come with authored normals, so the
+    # corresponding converter passes are skipped by default.
+    ignore_animations: bool = True
+    """Skip animation import during OBJ->USD conversion. Defaults to True."""
+
+    ignore_camera: bool = True
+    """Skip camera import during OBJ->USD conversion. Defaults to True."""
+
+    ignore_light: bool = True
+    """Skip light import during OBJ->USD conversion. Defaults to True."""
+
+    smooth_normals: bool = False
+    """Recompute smooth normals during OBJ->USD conversion. Defaults to False."""
+
+    embed_textures: bool = False
+    """Embed textures into the USD instead of referencing them on disk. Defaults to False."""
+
+    merge_all_meshes: bool = True
+    """Merge all meshes into a single prim during OBJ->USD conversion. Defaults to True."""
 
     # Add a switch to spawn a hidden ground plane for stability (optional)
     groundplane: bool = True
+
+    force_new_sim: bool = False
+    """Re-create the SimulationContext on import even if a compatible one exists. Defaults to False."""
@@ -0,0 +1,56 @@
+# Copyright (c) 2024 ETH Zurich (Robotic Systems Lab)
+# Author: Pascal Roth
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Timing and file-access helpers shared by the Matterport importer and the extension UI."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import time
+
+import carb
+import carb.profiler
+
+
+@contextlib.contextmanager
+def profile_zone(name: str, timings: dict[str, float], *, carb_zone: bool = False):
+    """Record the wall time of an import stage in ``timings[name]``.
+
+    With ``carb_zone`` the stage is also marked as ``matterport.<name>`` zone for the carb profiler. Only use it
+    for spans without awaits: carb zones are nested per thread, so a zone left open across an await interleaves
+    with whatever else the Kit loop runs in the meantime, including a second import.
+    """
+    if carb_zone:
+        carb.profiler.begin(1, f"matterport.{name}")
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = time.perf_counter() - start
+        if carb_zone:
+            carb.profiler.end(1)
+
+
+def advise_read(path: str, *advice: str) -> None:
+    """Pass ``posix_fadvise`` hints for a whole local file, e.g. ``advise_read(path, "WILLNEED")``.
+
+    The advice is given by the suffix of the ``os.POSIX_FADV_*`` constant. This is a best-effort hint,
+    it does nothing on platforms without ``posix_fadvise`` and ignores files that cannot be opened.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        for name in advice:
+            os.posix_fadvise(fd, 0, 0, getattr(os, f"POSIX_FADV_{name}"))
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -7,13 +7,14 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
 import os
 from typing import TYPE_CHECKING
 
 import carb
 
 # -- Isaac Sim 5.0 namespaces (preferred) --
-import isaacsim.core.utils.prims as prim_utils
 import isaacsim.core.utils.stage as stage_utils
 """
 Use Isaac Lab's SimulationContext singleton to avoid mixing two different
@@ -29,29 +30,204 @@ from isaaclab.terrains import TerrainImporter
 
 # Omniverse / Kit
 from isaacsim.core.utils import extensions
-extensions.enable_extension("omni.kit.asset_converter")
-import omni.kit.asset_converter as converter
-import omni.kit.app
-import omni
+import omni.client
+from pxr import Sdf
+
+from .import_utils import advise_read, profile_zone
 
 if TYPE_CHECKING:
     # Local typing only to avoid import cycles at import time
-    from .importer_cfg import MatterportImporterCfg
+    from ..config.importer_cfg import MatterportImporterCfg
+
+
+_USD_LAYER_CACHE: dict[str, tuple[Sdf.Layer, float]] = {}
+"""The USD layer of the last import and its file modification time, kept alive across imports.
+
+Holds a single entry, Matterport layers are large and only re-importing the same scene benefits from it.
+"""
+
+
+def _usd_path_for(obj_filepath: str) -> str:
+    base_path, ext = os.path.splitext(obj_filepath)
+    return base_path + ".usd" if ext.lower() == ".obj" else obj_filepath
+
+
+def _is_remote_path(path: str) -> bool:
+    return path.startswith("omniverse:")
+
+
+def _resolve_usd_path(obj_filepath: str) -> tuple[str, float | None]:
+    """Resolve the USD path for a local input file with a single stat call.
+
+    Returns the USD path and its modification time, or ``None`` as time if the USD does not exist yet.
+    """
+    usd_path = _usd_path_for(obj_filepath)
+    try:
+        return usd_path, os.stat(usd_path).st_mtime
+    except OSError:
+        return usd_path, None
+
+
+async def _resolve_usd_path_async(obj_filepath: str) -> tuple[str, float | None]:
+    """Async variant of :func:`_resolve_usd_path` that also handles Nucleus (``omniverse://``) paths.
+
+    Remote paths are checked with ``omni.client``, local paths are stat'ed in the default executor so slow
+    or networked drives do not block the event loop.
+    """
+    if _is_remote_path(obj_filepath):
+        usd_path = _usd_path_for(obj_filepath)
+        result, entry = await omni.client.stat_async(usd_path)
+        if result != omni.client.Result.OK:
+            return usd_path, None
+        return usd_path, entry.modified_time.timestamp()
+    return await asyncio.get_running_loop().run_in_executor(None, _resolve_usd_path, obj_filepath)
+
+
+def _retain_usd_layer(usd_path: str, mtime: float) -> Sdf.Layer | None:
+    """Keep the USD layer open so a repeated import reuses the parsed layer instead of re-reading it.
+
+    The layer is reloaded from disk only if the file changed since it was last opened and it has no unsaved
+    edits. Opening and reloading parse the whole file, so this is meant to run in an executor.
+    """
+    cached = _USD_LAYER_CACHE.get(usd_path)
+    if cached is not None:
+        layer, cached_mtime = cached
+        if cached_mtime != mtime:
+            if layer.dirty:
+                # reloading would silently drop the unsaved edits, keep them and import the layer as it is
+                carb.log_warn(f"[MatterportImporter] {usd_path} changed on disk but has unsaved edits, not reloading")
+            else:
+                layer.Reload()
+            _USD_LAYER_CACHE[usd_path] = (layer, mtime)
+        return layer
+    # note: binary (crate) layers are memory-mapped by the USD reader, so geometry is paged in on demand.
+    #   Do not set USDC_USE_PREAD here, it replaces the mapping with explicit reads.
+    try:
+        layer = Sdf.Layer.FindOrOpen(usd_path)
+    except Exception as exc:
+        carb.log_warn(f"[MatterportImporter] Could not pre-open USD layer {usd_path}, importing without it: {exc}")
+        return None
+    if layer is not None:
+        # release the previous scene's layer, it is only kept alive by this cache once it left the stage
+        _USD_LAYER_CACHE.clear()
+        _USD_LAYER_CACHE[usd_path] = (layer, mtime)
+    return layer
+
+
+_CONVERSION_FIELDS = (
+    "ignore_animations",
+    "ignore_camera",
+    "ignore_light",
+    "smooth_normals",
+    "embed_textures",
+    "merge_all_meshes",
+)
+"""Importer config fields the asset converter context is built from."""
+
+
+def _conversion_settings_key(cfg: MatterportImporterCfg) -> str:
+    """Converter settings of the importer config as a string, without creating the converter context."""
+    if cfg.asset_converter is not None:
+        return repr(sorted(vars(cfg.asset_converter).items()))
+    return repr([(name, getattr(cfg, name)) for name in _CONVERSION_FIELDS])
+
+
+def _file_digest(path: str) -> str:
+    """Digest of the full file contents, read in chunks so large OBJs are not loaded into memory at once."""
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _settings_digest(settings_key: str) -> str:
+    return hashlib.blake2b(settings_key.encode()).hexdigest()
+
+
+def _write_conversion_fingerprint(obj_filepath: str, usd_path: str, settings_key: str) -> None:
+    """Stamp the USD with the ``<usd>.convhash`` sidecar of the conversion that produced it.
+
+    The sidecar holds the digest of the OBJ contents and of the converter settings, one per line.
+    """
+    with open(usd_path + ".convhash", "w") as f:
+        f.write(f"{_file_digest(obj_filepath)}\n{_settings_digest(settings_key)}\n")
+
+
+def _discard_conversion_fingerprint(usd_path: str) -> None:
+    """Remove the ``<usd>.convhash`` sidecar, so an interrupted conversion does not leave a USD marked as valid."""
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(usd_path + ".convhash")
+
+
+def _needs_conversion(obj_filepath: str, usd_path: str, usd_mtime: float | None, settings_key: str) -> bool:
+    """Check whether the OBJ has to be (re-)converted to USD.
+
+    If the sidecar ``<usd>.convhash`` written by the last conversion exists, the USD is reconverted when the
+    converter settings changed, or when the OBJ is newer than the USD and its contents changed. Without a
+    sidecar, only a USD that is newer than its OBJ is reused.
+    """
+    if usd_mtime is None:
+        return True
+    try:
+        with open(usd_path + ".convhash") as f:
+            stamp = f.read().split()
+    except OSError:
+        stamp = None
+    if stamp is not None and (len(stamp) != 2 or stamp[1] != _settings_digest(settings_key)):
+        return True
+    try:
+        obj_mtime = os.stat(obj_filepath).st_mtime
+    except OSError:
+        # source is gone, the existing USD is all we have
+        return False
+    if usd_mtime >= obj_mtime:
+        return False
+    # a newer OBJ is only skipped if its contents are proven unchanged, e.g. after a copy or touch
+    return stamp is None or stamp[0] != _file_digest(obj_filepath)
 
 
 class MatterportConverter:
-    """Thin wrapper around omni.kit.asset_converter for OBJ->USD."""
-    def __init__(self, input_obj: str, context) -> None:
+    """Thin wrapper around omni.kit.asset_converter for OBJ->USD.
+
+    The asset converter extension is only enabled on first use, i.e. when an OBJ actually has to be converted.
+    """
+    def __init__(self, input_obj: str, context=None, cfg: MatterportImporterCfg | None = None) -> None:
         self._input_obj = input_obj
         self._context = context
-        # Use public singleton in 5.0/4.x; avoids extension-internal classes
-        self.task_manager = converter.get_instance()
+        self._cfg = cfg
+        self._task_manager = None
+        # fraction of the running conversion that is done, can be polled by UI code to show progress
+        self.progress = 0.0
+
+    @property
+    def context(self):
+        """Asset converter context, created from the importer config on first access."""
+        if self._context is None:
+            from ..config.importer_cfg import _make_asset_converter_cfg
 
-    async def convert_asset_to_usd(self) -> None:
+            self._context = _make_asset_converter_cfg(self._cfg)
+        return self._context
+
+    @property
+    def task_manager(self):
+        if self._task_manager is None:
+            extensions.enable_extension("omni.kit.asset_converter")
+            import omni.kit.asset_converter as converter
+
+            # Use public singleton in 5.0/4.x; avoids extension-internal classes
+            self._task_manager = converter.get_instance()
+        return self._task_manager
+
+    async def convert_asset_to_usd(self) -> bool:
+        """Convert the OBJ to a USD next to it. Returns whether the conversion succeeded."""
         base_path, _ = os.path.splitext(self._input_obj)
         dst = base_path + ".usd"
-        task = self.task_manager.create_converter_task(self._input_obj, dst, None, self._context)
+        self.progress = 0.0
+        # note: the conversion runs natively in the converter's worker; awaiting it does not block the loop
+        task = self.task_manager.create_converter_task(self._input_obj, dst, self._on_progress, self.context)
         success = await task.wait_until_finished()
+        self.progress = 1.0
         if not success:
             detailed_status_code = task.get_status()
             detailed_status_error_string = task.get_error_message()
@@ -59,6 +235,16 @@ class MatterportConverter:
                 f"[AssetConverter] Failed to convert {self._input_obj} -> {dst} "
                 f"(status={detailed_status_code}): {detailed_status_error_string}"
             )
+        return bool(success)
+
+    def _on_progress(self, current_step: int, total: int) -> None:
+        if total <= 0:
+            return
+        progress = current_step / total
+        # log in 10% increments to keep the console readable for large scenes
+        if int(progress * 10) > int(self.progress * 10):
+            carb.log_info(f"[AssetConverter] Converting {self._input_obj}: {progress:.0%}")
+        self.progress = progress
 
 
 class MatterportImporter(TerrainImporter):
@@ -66,18 +252,24 @@ class MatterportImporter(TerrainImporter):
 
     cfg: MatterportImporterCfg
 
+    _GROUND_PLANE_CFG: sim_utils.GroundPlaneCfg | None = None
+    """Ground plane spawn configuration, built on first use and shared across imports."""
+
     def __init__(self, cfg: MatterportImporterCfg) -> None:
         self._matterport_cfg = cfg
         self._is_terrain_imported = False
+        # wall time of the import stages in seconds, keyed by stage name
+        self.timings: dict[str, float] = {}
 
         # Prepare config for TerrainImporter compatibility
         self._prepare_terrain_config(cfg)
 
-        # Converter (kept optional; usd path preferred)
-        self.converter = MatterportConverter(cfg.obj_filepath, cfg.asset_converter)
+        # Converter (kept optional; usd path preferred, the asset converter is loaded lazily)
+        self._conversion_settings_key = _conversion_settings_key(cfg)
+        self.converter = MatterportConverter(cfg.obj_filepath, cfg.asset_converter, cfg)
 
         # Bypass TerrainImporter auto-import by temporarily nulling terrain_type
-        original_terrain_type = getattr(cfg, "terrain_type", None)
+        original_terrain_type = cfg.terrain_type
         cfg.terrain_type = None
         try:
             self._minimal_terrain_importer_init(cfg)
@@ -99,47 +291,76 @@ class MatterportImporter(TerrainImporter):
         self._terrain_flat_patches = dict()
 
     def _prepare_terrain_config(self, cfg: MatterportImporterCfg):
-        if not hasattr(cfg, "env_spacing") or cfg.env_spacing is None:
-            if getattr(cfg, "num_envs", 1) > 1:
-                cfg.env_spacing = 3.0
-            else:
-                cfg.env_spacing = 1.0
-        if not hasattr(cfg, "num_envs") or cfg.num_envs is None:
+        if cfg.num_envs is None:
             cfg.num_envs = 1
+        if cfg.env_spacing is None:
+            cfg.env_spacing = 3.0 if cfg.num_envs > 1 else 1.0
 
     async def setup_async(self):
         if self._is_terrain_imported:
             return
         await self._import_matterport_terrain_async()
         self.configure_env_origins()
-        self.set_debug_vis(getattr(self.cfg, "debug_vis", False))
+        self.set_debug_vis(self.cfg.debug_vis)
+        # single stage update for all edits made during import (reference, collider, ground plane)
         await stage_utils.update_stage_async()
         self._is_terrain_imported = True
         carb.log_info("[MatterportImporter] async setup complete.")
 
     async def _import_matterport_terrain_async(self):
-        base_path, ext = os.path.splitext(self._matterport_cfg.obj_filepath)
-        usd_path = base_path + ".usd" if ext.lower() == ".obj" else self._matterport_cfg.obj_filepath
-
-        # Convert if needed and permitted
-        if not os.path.exists(usd_path) and ext.lower() == ".obj":
-            carb.log_info("[MatterportImporter] USD not found; converting OBJ->USD...")
-            await self.converter.convert_asset_to_usd()
+        obj_filepath = self._matterport_cfg.obj_filepath
+        with profile_zone("resolve", self.timings):
+            usd_path, usd_mtime = await _resolve_usd_path_async(obj_filepath)
+
+            # Convert if needed and permitted
+            if obj_filepath.lower().endswith(".obj"):
+                if _is_remote_path(obj_filepath):
+                    # staleness checks need local file access, remote OBJs are only converted if the USD is missing
+                    needs_conversion = usd_mtime is None
+                else:
+                    needs_conversion = await asyncio.get_running_loop().run_in_executor(
+                        None, _needs_conversion, obj_filepath, usd_path, usd_mtime, self._conversion_settings_key
+                    )
+            else:
+                needs_conversion = False
+
+        if needs_conversion:
+            carb.log_info("[MatterportImporter] USD missing or outdated; converting OBJ->USD...")
+            if not _is_remote_path(obj_filepath):
+                await asyncio.get_running_loop().run_in_executor(None, _discard_conversion_fingerprint, usd_path)
+                # the converter only takes a path, so the OBJ cannot be handed over as a mapped buffer; start
+                #   reading it into the page cache while the conversion task is being set up instead
+                # note: only WILLNEED, access-pattern advice such as SEQUENTIAL applies to the open file and would
+                #   not reach the converter's own file handle
+                await asyncio.get_running_loop().run_in_executor(None, advise_read, obj_filepath, "WILLNEED")
+            with profile_zone("convert", self.timings):
+                converted = await self.converter.convert_asset_to_usd()
+            if not converted:
+                raise RuntimeError(f"Conversion of {obj_filepath} to USD failed")
             carb.log_info("[MatterportImporter] Conversion finished.")
+            usd_path, usd_mtime = await _resolve_usd_path_async(obj_filepath)
+            if usd_mtime is not None and not _is_remote_path(usd_path):
+                await asyncio.get_running_loop().run_in_executor(
+                    None, _write_conversion_fingerprint, obj_filepath, usd_path, self._conversion_settings_key
+                )
 
-        if not os.path.exists(usd_path):
+        if usd_mtime is None:
             raise FileNotFoundError(f"USD file not found: {usd_path}")
 
+        # Keep the layer open between imports; the reference authored below then resolves to it
+        await asyncio.get_running_loop().run_in_executor(None, _retain_usd_layer, usd_path, usd_mtime)
+
         # Cooperatively yield to the event loop without forcing Kit to step
         # other tasks from within this task's context (avoids re-entrancy).
         await asyncio.sleep(0)
 
         # Import as a Terrain (Isaac Lab TerrainImporter API)
-        self.import_usd("Matterport", usd_path)
-        await stage_utils.update_stage_async()
+        with profile_zone("import_usd", self.timings, carb_zone=True):
+            self.import_usd("Matterport", usd_path)
         carb.log_info(f"[MatterportImporter] Imported USD: {usd_path}")
 
-        await self._apply_physics_async()
+        with profile_zone("apply_physics", self.timings):
+            await self._apply_physics_async()
 
     async def _apply_physics_async(self):
         # Imported prim will live at {prim_path}/Matterport in 5.0 TerrainImporter
@@ -150,13 +371,13 @@ class MatterportImporter(TerrainImporter):
             sim_utils.define_collision_properties(matterport_prim_path, collider_cfg)
 
             # Optional ground plane
-            if getattr(self._matterport_cfg, "groundplane", False):
-                gp_cfg = sim_utils.GroundPlaneCfg()
+            if self._matterport_cfg.groundplane:
+                if MatterportImporter._GROUND_PLANE_CFG is None:
+                    MatterportImporter._GROUND_PLANE_CFG = sim_utils.GroundPlaneCfg()
+                gp_cfg = MatterportImporter._GROUND_PLANE_CFG
                 ground = gp_cfg.func("/World/GroundPlane", gp_cfg)
                 ground.visible = False
 
-        await stage_utils.update_stage_async()
-
     # Compatibility helpers
     @property
     def is_terrain_imported(self) -> bool:
@@ -168,7 +389,6 @@ class MatterportImporter(TerrainImporter):
 
     async def load_world_async(self) -> None:
         await self.setup_async()
-        await stage_utils.update_stage_async()
 
     def load_world(self) -> None:
         self.ensure_terrain_imported()
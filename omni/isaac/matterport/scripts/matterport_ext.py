@@ -2,17 +2,22 @@
 # SPDX-License-Identifier: BSD-3-Clause
 
 import asyncio
+import contextvars
+import cProfile
+import functools
+import io
 import os
+import pstats
 from typing import Optional
 
 import carb
+import carb.settings
 import omni
 import omni.ext
+import omni.kit.app
 import omni.usd
 
 # Isaac Sim 5.0 namespaces
-import isaacsim.core.utils.prims as prim_utils
-import isaacsim.core.utils.stage as stage_utils
 from isaaclab.sim import SimulationCfg, SimulationContext
 import isaaclab.sim as sim_utils
 
@@ -26,13 +31,50 @@ from isaacsim.gui.components.ui_utils import (
     str_builder,
 )
 import omni.kit.notification_manager as nm
+from pxr import Sdf, UsdGeom, UsdPhysics, UsdUtils
 
 # Local importer/config
 from ..config.importer_cfg import MatterportImporterCfg
+from ..domains.import_utils import advise_read, profile_zone
 from ..domains.matterport_importer import MatterportImporter
 
 EXTENSION_NAME = "Matterport Importer"
 MATTERPORT_CHILD_PRIM_NAME = "Matterport"
+PROFILE_SETTING = "/exts/omni.isaac.matterport/profile_import"
+FORCE_NEW_SIM_SETTING = "/exts/omni.isaac.matterport/force_new_sim"
+
+_FILE_CHANGE_DEBOUNCE_S = 0.15
+"""Delay in seconds after the last edit of the input file field before it is validated."""
+
+_DOCK_MAX_FRAMES = 300
+"""Number of frames to wait for the viewport window before giving up on docking."""
+
+_MESH_EXTS = frozenset((".obj", ".usd"))
+
+_DOC_LINK = "https://developer.nvidia.com/isaac-sim"
+_OVERVIEW = "Import a Matterport USD directly, or select an OBJ and let Asset Converter create USD first."
+
+_STYLE = None
+
+
+def _style():
+    # the UI style is static, build it once per extension load
+    global _STYLE
+    if _STYLE is None:
+        _STYLE = get_style()
+    return _STYLE
+
+
+def _schedule(coro):
+    """Schedule a coroutine that uses no context variables on the Kit loop.
+
+    The task runs in an empty context instead of a copy of the caller's one. Falls back to
+    ``run_coroutine`` if the loop does not accept a context.
+    """
+    try:
+        return asyncio.get_event_loop().create_task(coro, context=contextvars.Context())
+    except TypeError:
+        return run_coroutine(coro)
 
 
 def _get_stage():
@@ -43,81 +85,141 @@ def _get_stage():
     return stage
 
 
-def _ensure_container_prim(stage, prim_path: str):
-    from pxr import Sdf
+@functools.lru_cache(maxsize=64)
+def _matterport_child_path(prim_path: str) -> Sdf.Path:
+    # Sdf paths are immutable, parse each container path only once
+    return Sdf.Path(prim_path).AppendChild(MATTERPORT_CHILD_PRIM_NAME)
 
-    if not stage.GetPrimAtPath(prim_path):
-        stage.DefinePrim(Sdf.Path(prim_path), "Xform")
-    child_path = f"{prim_path}/{MATTERPORT_CHILD_PRIM_NAME}"
-    if not stage.GetPrimAtPath(child_path):
-        stage.DefinePrim(Sdf.Path(child_path), "Xform")
-    return child_path
 
+def _missing_prim_paths(stage, prim_path: Sdf.Path) -> list:
+    """Return the paths of ``prim_path`` and its ancestors that do not exist on the stage yet."""
+    return [path for path in prim_path.GetPrefixes() if not stage.GetPrimAtPath(path).IsValid()]
 
-def import_matterport_usd_reference(prim_path: str, usd_path: str) -> str:
-    """Import a USD file by referencing it under the given prim path."""
 
-    from pxr import Sdf
+def _define_prim_specs(layer, paths: list, type_names: dict) -> None:
+    """Author ``def`` prim specs in the layer, the Sdf counterpart of ``stage.DefinePrim``.
+
+    Unlike the Usd API this does not read composed data, so it is valid inside an ``Sdf.ChangeBlock``. The
+    stage is only recomposed once the block closes, so composed lookups (``GetPrimAtPath``) and Usd-API helpers
+    such as ``define_collision_properties`` run before or after the block, never within it.
+    """
+    for path in paths:
+        spec = Sdf.CreatePrimInLayer(layer, path)
+        spec.specifier = Sdf.SpecifierDef
+        type_name = type_names.get(path)
+        if type_name:
+            spec.typeName = type_name
 
-    stage = _get_stage()
-    child_path = _ensure_container_prim(stage, prim_path)
-    prim = stage.GetPrimAtPath(child_path)
-    prim.GetReferences().ClearReferences()
-    prim.GetReferences().AddReference(usd_path)
-    return child_path
 
+def _set_attribute_spec(prim_spec, name: str, type_name, value, variability=Sdf.VariabilityVarying) -> None:
+    attr_spec = prim_spec.attributes.get(name)
+    if attr_spec is None:
+        attr_spec = Sdf.AttributeSpec(prim_spec, name, type_name, variability)
+    attr_spec.default = value
+
+
+async def _acquire_simulation_context_async(force_new_sim: bool = False) -> SimulationContext:
+    """Return a ready SimulationContext, re-using the running one if its physics step matches.
+
+    A re-used context is only stopped to return to authoring mode, which keeps PhysX and Fabric alive.
+    """
+    sim_cfg = SimulationCfg()
+    sim = SimulationContext.instance()
+    if sim is not None and not force_new_sim and sim.get_physics_dt() == sim_cfg.dt:
+        await sim.stop_async()
+        return sim
+    if sim is not None:
+        SimulationContext.clear_instance()
+    sim = SimulationContext(sim_cfg)
+    await sim.initialize_simulation_context_async()
+    return sim
+
+
+def import_matterport_usd_reference(prim_path: str, usd_path: str, stage=None) -> str:
+    """Import a USD file by referencing it under the given prim path.
+
+    The active stage is used if no stage is given.
+    """
 
-def apply_matterport_collision(prim_path: str) -> str:
+    if stage is None:
+        stage = _get_stage()
+    child_sdf_path = _matterport_child_path(prim_path)
+    container_sdf_path = child_sdf_path.GetParentPath()
+    missing = _missing_prim_paths(stage, child_sdf_path)
+    layer = stage.GetEditTarget().GetLayer()
+    # author all edits in one change block so the stage recomposes once
+    with Sdf.ChangeBlock():
+        _define_prim_specs(layer, missing, {container_sdf_path: "Xform", child_sdf_path: "Xform"})
+        child_spec = Sdf.CreatePrimInLayer(layer, child_sdf_path)
+        # a prim that did not exist has no references to clear
+        if child_sdf_path not in missing:
+            child_spec.referenceList.ClearEdits()
+        child_spec.referenceList.Prepend(Sdf.Reference(usd_path))
+    return child_sdf_path.pathString
+
+
+# note: colliders are authored with the Usd-API helper define_collision_properties, so the helpers below call it
+#   outside of their change blocks (see _define_prim_specs)
+
+
+def apply_matterport_collision(prim_path: str, stage=None) -> str:
     """Apply a basic collider to the imported Matterport prim.
 
-    Returns the path to the Matterport prim.
+    The active stage is used if no stage is given. Returns the path to the Matterport prim.
     """
 
-    stage = _get_stage()
-    child_path = f"{prim_path}/{MATTERPORT_CHILD_PRIM_NAME}"
-    if not stage.GetPrimAtPath(child_path):
+    if stage is None:
+        stage = _get_stage()
+    child_sdf_path = _matterport_child_path(prim_path)
+    child_path = child_sdf_path.pathString
+    prim = stage.GetPrimAtPath(child_sdf_path)
+    if not prim.IsValid():
         raise RuntimeError(f"Matterport prim not found at '{child_path}'. Import USD first.")
+    # the importer already authors the collider for OBJ inputs, authoring it again would only re-cook the mesh
+    if prim.HasAPI(UsdPhysics.CollisionAPI) and UsdPhysics.CollisionAPI(prim).GetCollisionEnabledAttr().Get():
+        return child_path
 
     collider_cfg = sim_utils.CollisionPropertiesCfg(collision_enabled=True)
-    sim_utils.define_collision_properties(child_path, collider_cfg)
+    sim_utils.define_collision_properties(child_path, collider_cfg, stage=stage)
     return child_path
 
 
-def ensure_hidden_ground_plane(path: str = "/World/GroundPlane") -> None:
-    """Create or update a hidden ground plane that provides collision."""
-
-    from pxr import UsdGeom, Sdf, Gf, Usd
-
-    stage = _get_stage()
-    plane_path = f"{path}/Plane"
+def ensure_hidden_ground_plane(path: str = "/World/GroundPlane", stage=None) -> None:
+    """Create or update a hidden ground plane that provides collision.
 
-    if not stage.GetPrimAtPath(Sdf.Path(path)):
-        UsdGeom.Xform.Define(stage, Sdf.Path(path))
-
-    created = False
-    if not stage.GetPrimAtPath(Sdf.Path(plane_path)):
-        cube = UsdGeom.Cube.Define(stage, Sdf.Path(plane_path))
-        xform = UsdGeom.XformCommonAPI(cube.GetPrim())
-        try:
-            xform.SetScale(Gf.Vec3f(1000.0, 1000.0, 0.1), Usd.TimeCode.Default())
-        except Exception as exc:
-            carb.log_warn(f"[{EXTENSION_NAME}] Ground plane SetScale note: {exc}")
-        try:
-            xform.SetTranslate(Gf.Vec3d(0.0, 0.0, -0.05), Usd.TimeCode.Default())
-        except Exception as exc:
-            carb.log_warn(f"[{EXTENSION_NAME}] Ground plane SetTranslate note: {exc}")
-        created = True
-    else:
-        cube = UsdGeom.Cube(stage.GetPrimAtPath(Sdf.Path(plane_path)))
+    The active stage is used if no stage is given.
+    """
 
-    try:
-        UsdGeom.Imageable(cube.GetPrim()).MakeInvisible()
-    except Exception:
-        pass
+    if stage is None:
+        stage = _get_stage()
+    gp_sdf_path = Sdf.Path(path)
+    plane_sdf_path = gp_sdf_path.AppendChild("Plane")
+    plane_path = plane_sdf_path.pathString
+
+    missing = _missing_prim_paths(stage, plane_sdf_path)
+    created = plane_sdf_path in missing
+    layer = stage.GetEditTarget().GetLayer()
+    with Sdf.ChangeBlock():
+        # note: a plane instead of a flat cube, collision is then a single analytic plane and there is no
+        #   box geometry to cook or cull
+        _define_prim_specs(layer, missing, {gp_sdf_path: "Xform", plane_sdf_path: "Plane"})
+        plane_spec = Sdf.CreatePrimInLayer(layer, plane_sdf_path)
+        if created:
+            _set_attribute_spec(
+                plane_spec, UsdGeom.Tokens.axis, Sdf.ValueTypeNames.Token, UsdGeom.Tokens.z, Sdf.VariabilityUniform
+            )
+            _set_attribute_spec(plane_spec, UsdGeom.Tokens.length, Sdf.ValueTypeNames.Double, 2000.0)
+            _set_attribute_spec(plane_spec, UsdGeom.Tokens.width, Sdf.ValueTypeNames.Double, 2000.0)
+        # guide purpose keeps the plane out of the default render purposes, so Hydra skips it at sync time;
+        #   it stays invisible for viewports that do draw guides
+        _set_attribute_spec(
+            plane_spec, UsdGeom.Tokens.purpose, Sdf.ValueTypeNames.Token, UsdGeom.Tokens.guide, Sdf.VariabilityUniform
+        )
+        _set_attribute_spec(plane_spec, UsdGeom.Tokens.visibility, Sdf.ValueTypeNames.Token, UsdGeom.Tokens.invisible)
 
     try:
         collider_cfg = sim_utils.CollisionPropertiesCfg(collision_enabled=True)
-        sim_utils.define_collision_properties(plane_path, collider_cfg)
+        sim_utils.define_collision_properties(plane_path, collider_cfg, stage=stage)
     except Exception as exc:
         carb.log_warn(f"[{EXTENSION_NAME}] Ground plane collision note: {exc}")
 
@@ -125,6 +227,30 @@ def ensure_hidden_ground_plane(path: str = "/World/GroundPlane") -> None:
     carb.log_info(f"[{EXTENSION_NAME}] Ground plane {status} at {plane_path}")
 
 
+async def _resolve_input_path_async(input_path: str, resolve_relative_to: Optional[str]) -> str:
+    """Resolve a relative input path against ``resolve_relative_to`` if the file exists there."""
+    if not os.path.isabs(input_path) and resolve_relative_to:
+        candidate = os.path.join(resolve_relative_to, input_path)
+        if await asyncio.to_thread(os.path.isfile, candidate):
+            return candidate
+    return input_path
+
+
+def _prefetch_usd_dependencies(usd_path: str) -> list:
+    """Open all layers the USD depends on and start reading its other assets into the page cache.
+
+    Returns the opened layers, the caller keeps them alive until the reference is composed so the stage
+    picks them up from the layer registry instead of opening them again.
+    """
+    layers, assets, unresolved = UsdUtils.ComputeAllDependencies(usd_path)
+    if unresolved:
+        carb.log_warn(f"[{EXTENSION_NAME}] Unresolved dependencies of {usd_path}: {unresolved}")
+    # assets are returned resolved; textures and the like are read later by the renderer, start pulling them in
+    for asset_path in assets:
+        advise_read(asset_path, "WILLNEED")
+    return layers
+
+
 async def import_matterport_asset_async(
     prim_path: str,
     input_path: str,
@@ -132,39 +258,55 @@ async def import_matterport_asset_async(
     groundplane: bool = False,
     manage_simulation: bool = True,
     resolve_relative_to: Optional[str] = None,
+    prefetch_dependencies: bool = True,
+    force_new_sim: bool = False,
 ) -> str:
     """Programmatic entry-point to import a Matterport USD/OBJ into the stage.
 
+    For a USD input, ``prefetch_dependencies`` opens its layers and starts reading its other assets in a
+    worker thread before the reference is authored. Disable it for assets that are already cached locally.
+
+    A running simulation context is reused unless ``force_new_sim`` is set, the same flag as on the importer config.
+
     Returns the prim path of the imported Matterport root.
     """
 
     if not input_path:
         raise ValueError("input_path must be provided")
 
-    resolved_path = input_path
-    if not os.path.isabs(resolved_path) and resolve_relative_to:
-        candidate = os.path.join(resolve_relative_to, resolved_path)
-        if os.path.isfile(candidate):
-            resolved_path = candidate
-
-    sim = None
+    # the simulation bootstrap does not depend on the input file, so it overlaps with the path lookup
     if manage_simulation:
-        if SimulationContext.instance():
-            SimulationContext.clear_instance()
-        sim = SimulationContext(SimulationCfg())
-        await sim.initialize_simulation_context_async()
+        sim, resolved_path = await asyncio.gather(
+            _acquire_simulation_context_async(force_new_sim=force_new_sim),
+            _resolve_input_path_async(input_path, resolve_relative_to),
+        )
+    else:
+        sim = None
+        resolved_path = await _resolve_input_path_async(input_path, resolve_relative_to)
 
+    # look up the stage once and hand it to all stage helpers of this import
+    stage = _get_stage()
     if resolved_path.lower().endswith(".usd"):
-        import_matterport_usd_reference(prim_path, resolved_path)
+        prefetched = []
+        if prefetch_dependencies:
+            try:
+                prefetched = await asyncio.to_thread(_prefetch_usd_dependencies, resolved_path)
+            except Exception as exc:
+                carb.log_warn(f"[{EXTENSION_NAME}] Dependency prefetch of {resolved_path} skipped: {exc}")
+        import_matterport_usd_reference(prim_path, resolved_path, stage=stage)
+        # the stage holds its own references to the layers once the reference is composed
+        del prefetched
         if groundplane:
-            ensure_hidden_ground_plane()
+            ensure_hidden_ground_plane(stage=stage)
     else:
-        cfg = MatterportImporterCfg(prim_path=prim_path, obj_filepath=resolved_path, groundplane=groundplane)
+        cfg = MatterportImporterCfg(
+            prim_path=prim_path, obj_filepath=resolved_path, groundplane=groundplane, force_new_sim=force_new_sim
+        )
         importer = MatterportImporter(cfg)
         await importer.load_world_async()
 
     try:
-        apply_matterport_collision(prim_path)
+        apply_matterport_collision(prim_path, stage=stage)
     except Exception as exc:
         carb.log_warn(f"[{EXTENSION_NAME}] Matterport collision application note: {exc}")
 
@@ -172,7 +314,7 @@ async def import_matterport_asset_async(
         await sim.reset_async()
         await sim.pause_async()
 
-    return f"{prim_path}/{MATTERPORT_CHILD_PRIM_NAME}"
+    return _matterport_child_path(prim_path).pathString
 
 
 def import_matterport_asset(
@@ -182,6 +324,8 @@ def import_matterport_asset(
     groundplane: bool = False,
     manage_simulation: bool = True,
     resolve_relative_to: Optional[str] = None,
+    prefetch_dependencies: bool = True,
+    force_new_sim: bool = False,
 ):
     """Schedule the asynchronous Matterport import helper via Kit's async engine."""
 
@@ -192,18 +336,23 @@ def import_matterport_asset(
             groundplane=groundplane,
             manage_simulation=manage_simulation,
             resolve_relative_to=resolve_relative_to,
+            prefetch_dependencies=prefetch_dependencies,
+            force_new_sim=force_new_sim,
         )
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def _is_mesh_file(path: str) -> bool:
-    _, ext = os.path.splitext(path.lower())
-    return ext in [".obj", ".usd"]
+    # cached since the folder picker re-filters the same items while scrolling
+    # both extensions are four characters, so only the tail of the path is lowered
+    return path[-4:].lower() in _MESH_EXTS
 
 
 def _on_filter_mesh_item(item) -> bool:
     if not item or item.is_folder:
-        return not (item.name == "Omniverse" or item.path.startswith("omniverse:"))
+        # the "Omniverse" collection root is covered by its omniverse:// path
+        return not item.path.startswith("omniverse:")
     return _is_mesh_file(item.path)
 
 
@@ -212,6 +361,8 @@ class MatterPortExtension(omni.ext.IExt):
 
     def on_startup(self, ext_id):
         self._ext_id = ext_id
+        self._ext_dir = omni.kit.app.get_app().get_extension_manager().get_extension_path(ext_id)
+        self._ext_data_dir = os.path.join(self._ext_dir, "data") if self._ext_dir else None
         self._usd_context = omni.usd.get_context()
         self._window = omni.ui.Window(
             EXTENSION_NAME, width=380, height=280, visible=True, dockPreference=ui.DockPreference.LEFT_BOTTOM
@@ -220,109 +371,72 @@ class MatterPortExtension(omni.ext.IExt):
         # UI state
         self._prim_path = "/World/terrain"
         self._input_file = ""
+        self._file_change_task = None
+
+        # Widgets, assigned in _build_import_ui
+        self._import_btn = None
+        self._physics_btn = None
+        self._ground_btn = None
+        self._status_label = None
+        self._file_model = None
 
         # Build UI
         self._build_ui()
 
-        # Dock next to viewport (best-effort)
-        async def _dock():
-            # Yield cooperatively; avoid calling Kit frame stepper here
-            await asyncio.sleep(0)
-            target = ui.Workspace.get_window("Viewport")
-            if target:
-                w = ui.Workspace.get_window(EXTENSION_NAME)
-                if w:
-                    w.dock_in(target, ui.DockPosition.LEFT, 0.33)
-        run_coroutine(_dock())
-
-        # Import task state (driven by update callback, not awaits)
-        self._import_running = False
-        self._import_state = None
-        self._import_future = None
-        self._sim = None
-        self._importer = None
+        # Dock next to viewport (best-effort) once it exists; checked per frame and dropped after docking
+        self._dock_frames = 0
+        self._dock_sub = (
+            omni.kit.app.get_app()
+            .get_update_event_stream()
+            .create_subscription_to_pop(self._try_dock, name=f"{EXTENSION_NAME} dock")
+        )
 
-        # Per-frame driver to avoid re-entrancy: we never await inside this
-        def _on_update(e):
-            if not self._import_running:
-                return
+        # Prime the collision and importer config paths before the first button click
+        async def _warmup():
+            await asyncio.sleep(0)
+            sim_utils.CollisionPropertiesCfg(collision_enabled=True)
             try:
-                if self._import_state == "init_sim":
-                    carb.log_info(f"[{EXTENSION_NAME}] init_sim")
-                    if SimulationContext.instance():
-                        SimulationContext.clear_instance()
-                    self._sim = SimulationContext(SimulationCfg())
-                    self._import_future = run_coroutine(self._sim.initialize_simulation_context_async())
-                    self._import_state = "wait_init"
-                elif self._import_state == "wait_init":
-                    if self._import_future and self._import_future.done():
-                        exc = self._import_future.exception()
-                        if exc:
-                            raise exc
-                        self._import_future = None
-                        carb.log_info(f"[{EXTENSION_NAME}] sim initialized")
-                        self._import_state = "create_importer"
-                elif self._import_state == "create_importer":
-                    carb.log_info(f"[{EXTENSION_NAME}] create_importer")
-                    cfg = MatterportImporterCfg(
-                        prim_path=self._prim_path, obj_filepath=self._input_file, groundplane=False
-                    )
-                    self._importer = MatterportImporter(cfg)
-                    self._import_future = run_coroutine(self._importer.load_world_async())
-                    self._import_state = "wait_import"
-                elif self._import_state == "wait_import":
-                    if self._import_future and self._import_future.done():
-                        exc = self._import_future.exception()
-                        if exc:
-                            raise exc
-                        self._import_future = None
-                        carb.log_info(f"[{EXTENSION_NAME}] world loaded")
-                        self._import_state = "reset"
-                elif self._import_state == "reset":
-                    carb.log_info(f"[{EXTENSION_NAME}] reset")
-                    self._import_future = run_coroutine(self._sim.reset_async())
-                    self._import_state = "wait_reset"
-                elif self._import_state == "wait_reset":
-                    if self._import_future and self._import_future.done():
-                        exc = self._import_future.exception()
-                        if exc:
-                            raise exc
-                        self._import_future = None
-                        carb.log_info(f"[{EXTENSION_NAME}] pause")
-                        self._import_state = "pause"
-                elif self._import_state == "pause":
-                    self._import_future = run_coroutine(self._sim.pause_async())
-                    self._import_state = "wait_pause"
-                elif self._import_state == "wait_pause":
-                    if self._import_future and self._import_future.done():
-                        exc = self._import_future.exception()
-                        if exc:
-                            raise exc
-                        self._import_future = None
-                        carb.log_info(
-                            f"[{EXTENSION_NAME}] Imported scene at {self._prim_path} from {self._input_file}"
-                        )
-                        self._import_state = "done"
-                elif self._import_state == "done":
-                    # cleanup and re-enable UI
-                    self._import_running = False
-                    if hasattr(self, "_import_btn"):
-                        self._import_btn.enabled = True
+                MatterportImporterCfg(prim_path="/World/__warmup", obj_filepath="", groundplane=False)
             except Exception as exc:
-                carb.log_error(f"[{EXTENSION_NAME}] Import failed: {exc}")
-                self._import_running = False
-                if hasattr(self, "_import_btn"):
-                    self._import_btn.enabled = True
+                carb.log_warn(f"[{EXTENSION_NAME}] Importer config warmup note: {exc}")
+            carb.log_info(f"[{EXTENSION_NAME}] warmup done")
+        _schedule(_warmup())
 
-        self._update_sub = omni.kit.app.get_app().get_update_event_stream().create_subscription_to_push(_on_update)
+        # Import task state (a single coroutine per import, see _load_matterport_async)
+        self._import_task = None
+        self._import_error = None
+        self._sim = None
+        self._importer = None
 
     def on_shutdown(self):
+        # drop pending work so a hot-reload does not keep callbacks of the old instance alive
+        self._dock_sub = None
+        for task in (self._import_task, self._file_change_task):
+            if task is not None and not task.done():
+                task.cancel()
+        self._import_task = None
+        self._file_change_task = None
+        self._sim = None
+        self._importer = None
+        # done-callbacks of cancelled tasks must not touch destroyed widgets
+        self._import_btn = None
+        self._status_label = None
         if self._window:
             self._window = None
         # Avoid clearing the whole stage here to not surprise users
 
     # ---------------- UI ----------------
 
+    def _try_dock(self, event=None):
+        target = ui.Workspace.get_window("Viewport")
+        self._dock_frames += 1
+        if target is None and self._dock_frames < _DOCK_MAX_FRAMES:
+            return
+        # docked or the viewport never showed up (e.g. headless), either way stop checking
+        self._dock_sub = None
+        if target is not None and self._window is not None:
+            self._window.dock_in(target, ui.DockPosition.LEFT, 0.33)
+
     def _build_ui(self):
         with self._window.frame:
             with ui.VStack(spacing=5, height=0):
@@ -330,24 +444,19 @@ class MatterPortExtension(omni.ext.IExt):
                 self._build_import_ui()
 
     def _build_info_ui(self):
-        title = EXTENSION_NAME
-        doc_link = "https://developer.nvidia.com/isaac-sim"
-        overview = (
-            "Import a Matterport USD directly, or select an OBJ and let Asset Converter create USD first."
-        )
-        setup_ui_headers(self._ext_id, __file__, title, doc_link, overview)
+        setup_ui_headers(self._ext_id, __file__, EXTENSION_NAME, _DOC_LINK, _OVERVIEW)
 
     def _build_import_ui(self):
         frame = ui.CollapsableFrame(
             title="Import",
             height=0,
             collapsed=False,
-            style=get_style(),
+            style=_style(),
             style_type_name_override="CollapsableFrame",
             vertical_scrollbar_policy=ui.ScrollBarPolicy.SCROLLBAR_AS_NEEDED,
         )
         with frame:
-            with ui.VStack(style=get_style(), spacing=6, height=0):
+            with ui.VStack(style=_style(), spacing=6, height=0):
                 # prim path input
                 prim_model = str_builder(
                     "Environment Prim Path",
@@ -357,15 +466,6 @@ class MatterPortExtension(omni.ext.IExt):
                 prim_model.add_value_changed_fn(lambda m: setattr(self, "_prim_path", m.get_value_as_string()))
 
                 # file path picker
-                def _on_file_change(model=None):
-                    val = model.get_value_as_string()
-                    if _is_mesh_file(val):
-                        self._input_file = val
-                        self._import_btn.enabled = True
-                    else:
-                        self._import_btn.enabled = False
-                        carb.log_warn(f"Invalid mesh path: {val}")
-
                 self._file_model = str_builder(
                     "Input File",
                     default_val=self._input_file,
@@ -375,7 +475,7 @@ class MatterPortExtension(omni.ext.IExt):
                     folder_dialog_title="Select .usd or .obj",
                     folder_button_title="Select",
                 )
-                self._file_model.add_value_changed_fn(_on_file_change)
+                self._file_model.add_value_changed_fn(self._on_file_change)
 
                 self._import_btn = btn_builder("Import", text="Import", on_clicked_fn=self._start_import)
                 self._import_btn.enabled = False
@@ -395,68 +495,165 @@ class MatterPortExtension(omni.ext.IExt):
                 # Status label
                 self._status_label = ui.Label("Ready", name="matterport_status", height=0)
                 
-    def _set_status(self, text: str):
-        try:
-            if hasattr(self, "_status_label") and self._status_label:
-                self._status_label.text = text
+    def _on_file_change(self, model=None):
+        # debounce: only the last value typed within the window is validated
+        if self._file_change_task is not None and not self._file_change_task.done():
+            self._file_change_task.cancel()
+        self._file_change_task = _schedule(self._apply_file_value_later(model.get_value_as_string()))
+
+    async def _apply_file_value_later(self, val: str):
+        await asyncio.sleep(_FILE_CHANGE_DEBOUNCE_S)
+        self._apply_file_value(val)
+
+    def _apply_file_value(self, val: str):
+        if self._window is None:
+            return
+        if _is_mesh_file(val):
+            self._input_file = val
+            self._import_btn.enabled = True
+        else:
+            self._import_btn.enabled = False
+            carb.log_warn(f"Invalid mesh path: {val}")
+
+    def _log(self, msg: str):
+        # carb mirrors to stdout when configured, no separate print needed
+        carb.log_info(f"[{EXTENSION_NAME}] {msg}")
+
+    def _log_error(self, msg: str):
+        carb.log_error(f"[{EXTENSION_NAME}] {msg}")
+
+    def _set_status(self, text: str, important: bool = False):
+        """Show the text in the status label; important (terminal) events are also posted as notification."""
+        if self._status_label is not None:
+            self._status_label.text = text
+        if important:
             try:
                 nm.post_notification(text, duration=3)
-            except Exception:
-                pass
-        except Exception:
-            pass
+            except Exception as exc:
+                carb.log_warn(f"[{EXTENSION_NAME}] Could not post notification: {exc}")
 
     # ---------------- Import logic ----------------
 
     def _start_import(self):
         if not self._input_file:
             carb.log_warn("No input file selected.")
-            print(f"[{EXTENSION_NAME}] No input file selected.")
-            self._set_status("No input file selected")
+            self._set_status("No input file selected", important=True)
             return
 
-        # If the user selected a relative extension path, try to resolve against extension dir
-        if not os.path.isabs(self._input_file):
-            ext_path = omni.kit.app.get_app().get_extension_manager().get_extension_path(self._ext_id)
-            candidate = os.path.join(ext_path, "data", self._input_file)
-            if os.path.isfile(candidate):
-                self._input_file = candidate
+        # prevent overlapping imports; the task covers path resolution as well as the OBJ pipeline
+        if self._import_task is not None and not self._import_task.done():
+            carb.log_warn("Import already running; ignoring request.")
+            return
+        input_file = self._input_file
+        if not os.path.isabs(input_file) and self._ext_data_dir:
+            # a relative extension path is looked up on disk, which can block on network filesystems
+            self._import_task = run_coroutine(self._resolve_and_import_async(input_file))
+        else:
+            self._dispatch_import(input_file)
+
+    async def _resolve_and_import_async(self, input_file: str):
+        self._dispatch_import(await _resolve_input_path_async(input_file, self._ext_data_dir))
 
+    def _dispatch_import(self, input_file: str):
         # USD-only fast path (no asyncio, safest to avoid re-entrancy)
-        if self._input_file.lower().endswith(".usd"):
+        if input_file.lower().endswith(".usd"):
             try:
-                self._simple_import_usd(self._input_file)
-                carb.log_info(f"[{EXTENSION_NAME}] Simple USD import done: {self._input_file}")
-                print(f"[{EXTENSION_NAME}] Simple USD import done: {self._input_file}")
-                self._set_status("USD imported successfully")
+                self._simple_import_usd(input_file)
+                self._log(f"Simple USD import done: {input_file}")
+                self._set_status("USD imported successfully", important=True)
             except Exception as exc:
-                carb.log_error(f"[{EXTENSION_NAME}] Simple USD import failed: {exc}")
-                print(f"[{EXTENSION_NAME}] Simple USD import failed: {exc}")
-                self._set_status(f"Import failed: {exc}")
+                self._log_error(f"Simple USD import failed: {exc}")
+                self._set_status(f"Import failed: {exc}", important=True)
             return
 
-        # prevent overlapping imports for advanced path
-        if self._import_running:
-            carb.log_warn("Import already running; ignoring request.")
-            return
-        self._import_running = True
-        self._import_state = "init_sim"
-        self._import_future = None
-        if hasattr(self, "_import_btn"):
+        if self._import_btn is not None:
             self._import_btn.enabled = False
+        self._import_task = run_coroutine(self._load_matterport_async(input_file))
+        self._import_task.add_done_callback(self._on_import_done)
 
-    async def _load_matterport_async(self):
-        # Legacy path retained for API stability; now unused.
-        carb.log_warn(
-            f"[{EXTENSION_NAME}] _load_matterport_async is deprecated; using frame-driven import instead."
-        )
+    async def _load_matterport_async(self, input_file: str):
+        """Run the OBJ import pipeline; each step resumes only once the previous one completed.
+
+        If the ``profile_import`` extension setting is enabled, per-stage timings and a cProfile summary
+        are logged once the import finished. The profiler stays enabled across the awaits of the import,
+        so its summary also contains whatever else Kit runs on the main thread in the meantime.
+
+        The ``force_new_sim`` extension setting is passed on to the importer config.
+        """
+        settings = carb.settings.get_settings()
+        profile = settings.get(PROFILE_SETTING)
+        profiler = cProfile.Profile() if profile else None
+        timings: dict[str, float] = {}
+        step = "init_sim"
+        self._import_error = None
+        try:
+            if profiler is not None:
+                profiler.enable()
+            self._log("init_sim")
+            cfg = MatterportImporterCfg(
+                prim_path=self._prim_path,
+                obj_filepath=input_file,
+                groundplane=False,
+                force_new_sim=bool(settings.get(FORCE_NEW_SIM_SETTING)),
+            )
+            with profile_zone(step, timings):
+                self._sim = await _acquire_simulation_context_async(force_new_sim=cfg.force_new_sim)
+            self._log("sim initialized")
+
+            step = "create_importer"
+            self._log("create_importer")
+            self._importer = MatterportImporter(cfg)
+            step = "load_world"
+            with profile_zone(step, timings):
+                await self._importer.load_world_async()
+            timings.update(self._importer.timings)
+            self._log("world loaded")
+
+            step = "reset"
+            self._log("reset")
+            with profile_zone(step, timings):
+                await self._sim.reset_async()
+            step = "pause"
+            self._log("pause")
+            with profile_zone(step, timings):
+                await self._sim.pause_async()
+            self._log(f"Imported scene at {self._prim_path} from {input_file}")
+            return True
+        except Exception as exc:
+            self._log_error(f"Import failed during {step}: {exc}")
+            self._import_error = f"{step}: {exc}"
+            return False
+        finally:
+            # the importer and its buffers are not needed once the scene is on the stage; Apply Physics and
+            # Add Ground Plane only work on the stage and do not depend on either reference
+            self._importer = None
+            self._sim = None
+            if profiler is not None:
+                profiler.disable()
+                summary = ", ".join(f"{name}={duration:.3f}s" for name, duration in timings.items())
+                self._log(f"Import timings: {summary}")
+                stream = io.StringIO()
+                pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(20)
+                self._log(f"Import profile:\n{stream.getvalue()}")
+
+    def _on_import_done(self, task) -> None:
+        # re-enable UI once the import coroutine finished, successfully or not
+        if self._import_btn is not None:
+            self._import_btn.enabled = True
+        if task.cancelled():
+            self._set_status("Import cancelled")
+        elif task.result():
+            self._set_status("OBJ imported successfully", important=True)
+        else:
+            self._set_status(f"Import failed during {self._import_error}", important=True)
 
     # ---------------- Simple USD import (no asyncio) ----------------
     def _simple_import_usd(self, usd_path: str) -> None:
         """Import a USD by adding a reference under prim_path/Matterport.
 
-        This path avoids any async calls to completely sidestep Kit's
-        task stepper re-entrancy.
+        The import itself makes no async calls, to completely sidestep Kit's
+        task stepper re-entrancy. Only a relative extension path is resolved
+        in a task before it is called.
         """
         import_matterport_usd_reference(self._prim_path, usd_path)
         self._set_status("Reference added to stage")
@@ -470,28 +667,24 @@ class MatterPortExtension(omni.ext.IExt):
         """
         try:
             matterport_prim_path = apply_matterport_collision(self._prim_path)
-            carb.log_info(f"[{EXTENSION_NAME}] Applied collision to {matterport_prim_path}")
-            print(f"[{EXTENSION_NAME}] Applied collision to {matterport_prim_path}")
-            self._set_status("Collision applied")
+            self._log(f"Applied collision to {matterport_prim_path}")
+            self._set_status("Collision applied", important=True)
         except Exception as exc:
-            carb.log_error(f"[{EXTENSION_NAME}] Apply Physics failed: {exc}")
-            print(f"[{EXTENSION_NAME}] Apply Physics failed: {exc}")
-            self._set_status(f"Apply Physics failed: {exc}")
+            self._log_error(f"Apply Physics failed: {exc}")
+            self._set_status(f"Apply Physics failed: {exc}", important=True)
 
     def _add_ground_plane_sync(self) -> None:
         """Create a hidden ground plane at /World/GroundPlane synchronously.
 
         To avoid dependencies on SimulationContext and async helpers, we
-        define a large thin cube as the plane, make it invisible, and enable
-        collision on it. This works in a single frame and avoids re-entrancy.
+        define a large plane prim with guide purpose, make it invisible, and
+        enable collision on it. This works in a single frame and avoids re-entrancy.
         """
         try:
             ensure_hidden_ground_plane()
             msg = "Ground plane ready at /World/GroundPlane/Plane (hidden/collidable)"
-            carb.log_info(f"[{EXTENSION_NAME}] {msg}")
-            print(f"[{EXTENSION_NAME}] {msg}")
-            self._set_status("Ground plane added (hidden)")
+            self._log(msg)
+            self._set_status("Ground plane added (hidden)", important=True)
         except Exception as exc:
-            carb.log_error(f"[{EXTENSION_NAME}] Add Ground Plane failed: {exc}")
-            print(f"[{EXTENSION_NAME}] Add Ground Plane failed: {exc}")
-            self._set_status(f"Add Ground Plane failed: {exc}")
+            self._log_error(f"Add Ground Plane failed: {exc}")
+            self._set_status(f"Add Ground Plane failed: {exc}", important=True)